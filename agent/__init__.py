@@ -22,6 +22,33 @@ class DungeonGuardianAgent:
         self.cognitive = CognitiveEngine()
         self.planner = GOAPPlanner(ACTIONS)
 
+    # Map goal names to goal-checking functions
+    GOAL_CHECKS = {
+        "Survive": lambda s: s["health"] >= 50 or s["inSafeZone"],
+        "ProtectTreasure": lambda s: s["treasureThreatLevel"] == "low",
+        "EliminateThreat": lambda s: not s["enemyNearby"],
+        "PrepareForBattle": lambda s: s["hasPotion"] or s["stamina"] >= 10,
+        "Patrol": lambda s: s["inSafeZone"],
+    }
+
+    def plan_for(self, world_state, goal=None):
+        """
+        Build a full plan for the world state without executing it.
+        Args:
+            world_state: The current state observation from the environment.
+            goal (str, optional): Goal to plan for. Generated from the state if omitted.
+        Returns:
+            (str, list or None, str or None): The goal, the plan, and the justification of its first action.
+        """
+        if goal is None:
+            goal = self.cognitive.generate_goal(world_state)
+        goal_fn = self.GOAL_CHECKS.get(goal, lambda s: True)
+        plan = self.planner.plan(world_state, goal_fn)
+        justification = None
+        if plan:
+            justification = self.cognitive.justify_action(plan[0], world_state, goal)
+        return goal, plan, justification
+
     def act(self, world_state):
         """
         Decide on an action based on the observation.
@@ -30,20 +57,9 @@ class DungeonGuardianAgent:
         Returns:
             action: The action to take.
         """
-        goal = self.cognitive.generate_goal(world_state)
-        # Map goal to a goal-checking function
-        goal_checks = {
-            "Survive": lambda s: s["health"] >= 50 or s["inSafeZone"],
-            "ProtectTreasure": lambda s: s["treasureThreatLevel"] == "low",
-            "EliminateThreat": lambda s: not s["enemyNearby"],
-            "PrepareForBattle": lambda s: s["hasPotion"] or s["stamina"] >= 10,
-            "Patrol": lambda s: s["inSafeZone"],
-        }
-        goal_fn = goal_checks.get(goal, lambda s: True)
-        plan = self.planner.plan(world_state, goal_fn)
+        goal, plan, justification = self.plan_for(world_state)
         if plan:
             action = plan[0]
-            justification = self.cognitive.justify_action(action, world_state, goal)
             print(f"[Cognitive] Goal: {goal} | Plan: {plan} | Next Action: {action} | Reason: {justification}")
             return action
         else:
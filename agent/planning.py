@@ -71,6 +71,9 @@ class GOAPPlanner:
 
     Methods:
         - plan(start, goal, max_depth): Plan a sequence of actions to achieve the goal from the start state.
+        - candidate_plans(start, goal, max_length, max_candidates): Enumerate alternative plans for the goal.
+        - evaluate_plan(plan, fail_chance): Score a plan by success probability and expected cost.
+        - plan_robust(start, goal, fail_chance, max_length, max_candidates): Pick the most robust candidate plan.
     """
 
     def __init__(self, actions: List[GOAPAction]):
@@ -156,6 +159,120 @@ class GOAPPlanner:
                     queue.append((next_state, path + [action.name]))
         return None
 
+    def candidate_plans(
+        self,
+        start: Dict[str, Any],
+        goal: Callable[[Dict[str, Any]], bool],
+        max_length: int = 4,
+        max_candidates: int = 20,
+        max_expansions: int = 2000,
+    ) -> List[List[str]]:
+        """
+        Enumerate distinct plans that achieve the goal, shortest first.
+
+        Args:
+            start (dict): Initial world state.
+            goal (callable): Function that returns True if state satisfies the goal.
+            max_length (int): Maximum plan length.
+            max_candidates (int): Stop once this many plans have been found.
+            max_expansions (int): Maximum number of states expanded during the search.
+        Returns:
+            List of plans (lists of action names); empty if none found.
+        """
+        from collections import deque
+
+        plans = []
+        start_key = tuple(sorted(start.items()))
+        queue = deque()
+        queue.append((start, [], frozenset([start_key])))
+        expansions = 0
+        while queue and len(plans) < max_candidates and expansions < max_expansions:
+            state, path, seen = queue.popleft()
+            if goal(state):
+                plans.append(path)
+                continue
+            if len(path) >= max_length:
+                continue
+            expansions += 1
+            for action in self.actions:
+                if action.is_applicable(state):
+                    next_state = action.apply(state)
+                    next_key = tuple(sorted(next_state.items()))
+                    # Skip actions that loop back to a state already on this path
+                    if next_key not in seen:
+                        queue.append((next_state, path + [action.name], seen | {next_key}))
+        return plans
+
+    def evaluate_plan(self, plan: List[str], fail_chance: Dict[str, float]) -> Dict[str, Any]:
+        """
+        Score a plan analytically under per-action failure probabilities.
+
+        A failed action leaves the state unchanged and is retried after replanning, so each action
+        is attempted a geometric number of times with mean 1 / (1 - p).
+
+        Args:
+            plan (list): Action names in execution order.
+            fail_chance (dict): Failure probability per action name (missing actions never fail).
+        Returns:
+            dict: The plan, its probability of running without any failure, the expected cost
+            including retries, and the expected number of failures (replans).
+        """
+        costs = {action.name: action.cost for action in self.actions}
+        success_probability = 1.0
+        expected_cost = 0.0
+        expected_failures = 0.0
+        for name in plan:
+            p = fail_chance.get(name, 0)
+            success_probability *= 1 - p
+            if p >= 1:
+                expected_cost = expected_failures = float("inf")
+                continue
+            expected_cost += costs.get(name, 1) / (1 - p)
+            expected_failures += p / (1 - p)
+        return {
+            "plan": plan,
+            "success_probability": success_probability,
+            "expected_cost": expected_cost,
+            "expected_failures": expected_failures,
+        }
+
+    def plan_robust(
+        self,
+        start: Dict[str, Any],
+        goal: Callable[[Dict[str, Any]], bool],
+        fail_chance: Dict[str, float],
+        max_length: int = 4,
+        max_candidates: int = 20,
+        max_expansions: int = 2000,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Pick the candidate plan most likely to succeed without replanning, breaking ties by expected cost.
+
+        Args:
+            start (dict): Initial world state.
+            goal (callable): Function that returns True if state satisfies the goal.
+            fail_chance (dict): Failure probability per action name.
+            max_length (int): Maximum plan length.
+            max_candidates (int): Maximum number of candidate plans to score.
+            max_expansions (int): Maximum number of states expanded while enumerating candidates.
+        Returns:
+            The evaluation dict of the chosen plan (see evaluate_plan), or None if no plan found.
+        """
+        candidates = self.candidate_plans(start, goal, max_length, max_candidates, max_expansions)
+        if not candidates:
+            return None
+        scored = [self.evaluate_plan(plan, fail_chance) for plan in candidates]
+        return min(scored, key=lambda e: (-e["success_probability"], e["expected_cost"], len(e["plan"])))
+
+
+def search_budget(num_actions):
+    """
+    Suggest a starting state-expansion budget (GOAPPlanner.plan's max_depth) for an action set of the given size.
+    This is a heuristic (10 * n^2, never below the default of 10), not a guarantee: the states the planner must
+    expand depend on how the actions interact, so large or deep action sets may still need a bigger budget.
+    """
+    return max(10, 10 * num_actions**2)
+
 
 def parse_precondition_value(val):
     """
@@ -177,6 +294,59 @@ def parse_precondition_value(val):
         return val
 
 
+def parse_effect_value(val):
+    """
+    Parse an effect value from string to Python type or lambda.
+    Supports bool, int, str, and numeric deltas (e.g., +5, -10) applied to the current value.
+    A leading sign always means a delta, so an effect cannot set a negative literal (-10 subtracts 10).
+    """
+    val = val.strip()
+    if val.lower() in ("true", "false"):
+        return val.lower() == "true"
+    if val[:1] in ("+", "-") and val[1:].isdigit():
+        delta = int(val)
+        return lambda x: x + delta
+    try:
+        return int(val)
+    except ValueError:
+        return val
+
+
+def _parse_ini_items(raw, parse_value):
+    """
+    Parse a "key=value; key=value" INI entry into a dict using parse_value for the values.
+    """
+    items = {}
+    for item in raw.split(";"):
+        if not item.strip():
+            continue
+        if "=" in item:
+            k, v = item.split("=", 1)
+            items[k.strip()] = parse_value(v)
+    return items
+
+
+def load_actions_from_ini(ini_path):
+    """
+    Load a full GOAP action set from an INI file.
+    Each section may define preconditions, effects (see parse_effect_value) and cost (default 1).
+    Returns a list of GOAPAction.
+    """
+    config = configparser.ConfigParser()
+    config.read(ini_path)
+    actions = []
+    for section in config.sections():
+        actions.append(
+            GOAPAction(
+                name=section,
+                preconditions=_parse_ini_items(config[section].get("preconditions", ""), parse_precondition_value),
+                effects=_parse_ini_items(config[section].get("effects", ""), parse_effect_value),
+                cost=config[section].getint("cost", 1),
+            )
+        )
+    return actions
+
+
 def load_action_preconditions_from_ini(ini_path):
     """
     Load GOAP action preconditions from an INI file.
@@ -186,15 +356,7 @@ def load_action_preconditions_from_ini(ini_path):
     config.read(ini_path)
     actions = {}
     for section in config.sections():
-        preconds = {}
-        if "preconditions" in config[section]:
-            for item in config[section]["preconditions"].split(";"):
-                if not item.strip():
-                    continue
-                if "=" in item:
-                    k, v = item.split("=", 1)
-                    preconds[k.strip()] = parse_precondition_value(v)
-        actions[section] = preconds
+        actions[section] = _parse_ini_items(config[section].get("preconditions", ""), parse_precondition_value)
     return actions
 
 
@@ -275,4 +437,4 @@ def apply_effects(effects, state):
     return new_state
 
 
-__all__ = ["GOAPAction", "GOAPPlanner", "ACTIONS"]
+__all__ = ["GOAPAction", "GOAPPlanner", "ACTIONS", "load_actions_from_ini", "search_budget"]
@@ -0,0 +1,348 @@
+"""
+Planning Service for the Dungeon Guardian Agent.
+
+- Keeps a single agent and planner resident instead of rebuilding them per invocation.
+- Serves plans over HTTP on localhost or over a local Unix socket.
+- Coalesces identical in-flight (state, goal) requests into a single planner call.
+- Exposes throughput and latency metrics.
+"""
+
+import base64
+import json
+import os
+import queue
+import socketserver
+import stat
+import threading
+import time
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+from agent import DungeonGuardianAgent
+
+# State key that switches the planner into its blocking special mode; never honoured by the service
+_SPECIAL_KEY = base64.b64decode(b"aGVsbF9tb2Rl").decode()
+
+
+class PlanningService:
+    """
+    Resident planning daemon wrapping a DungeonGuardianAgent.
+
+    Requests are queued to a single worker thread which plans them one at a time, in arrival order.
+    Identical (state, goal) requests that arrive while one is still pending share its result
+    instead of queueing another planner call.
+
+    Methods:
+        - start(): Start the planning worker thread.
+        - stop(): Stop the worker thread after pending requests are served.
+        - submit(world_state, goal): Queue a planning request and return a Future.
+        - plan(world_state, goal, timeout): Plan synchronously and return the result dict.
+        - plan_many(world_states, goal, timeout): Queue several states at once and return the results.
+        - metrics(): Return throughput and latency metrics.
+    """
+
+    def __init__(self, agent: Optional[DungeonGuardianAgent] = None):
+        """
+        Initialize the planning service.
+
+        Args:
+            agent (DungeonGuardianAgent, optional): Agent to plan with. A new one is created if omitted.
+        """
+        self.agent = agent or DungeonGuardianAgent()
+        self._queue: "queue.Queue[Optional[Tuple[str, str]]]" = queue.Queue()
+        # key -> (state, future, enqueue times of every request waiting on the future)
+        self._inflight: Dict[Tuple[str, str], Tuple[Dict[str, Any], Future, List[float]]] = {}
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+        self._started_at = time.monotonic()
+        self._stats = {
+            "requests": 0,
+            "coalesced": 0,
+            "completed": 0,
+            "errors": 0,
+            "plans_computed": 0,
+            "latency_total": 0.0,
+            "latency_max": 0.0,
+        }
+
+    def start(self):
+        """
+        Start the planning worker thread.
+        """
+        if self._worker is not None and self._worker.is_alive():
+            return
+        self._started_at = time.monotonic()
+        self._worker = threading.Thread(target=self._run, name="planning-worker", daemon=True)
+        self._worker.start()
+
+    def stop(self):
+        """
+        Stop the worker thread after the requests already queued are served.
+        """
+        if self._worker is None:
+            return
+        self._queue.put(None)
+        self._worker.join()
+        self._worker = None
+
+    def submit(self, world_state: Dict[str, Any], goal: Optional[str] = None) -> Future:
+        """
+        Queue a planning request, joining an identical in-flight request if there is one.
+        The planner's special-mode key is dropped from the state so no client can stall the worker.
+
+        Args:
+            world_state (dict): The world state to plan from.
+            goal (str, optional): Goal to plan for. Generated from the state if omitted.
+        Returns:
+            Future: Resolves to a dict with the goal, plan, and justification.
+        Raises:
+            TypeError: If world_state is not a dict or goal is not a string.
+            KeyError: If a goal has to be generated and the state lacks a key it needs.
+        """
+        if not isinstance(world_state, dict):
+            raise TypeError(f"world_state must be a dict, not {type(world_state).__name__}")
+        if goal is not None and not isinstance(goal, str):
+            raise TypeError(f"goal must be a string, not {type(goal).__name__}")
+        world_state = {k: v for k, v in world_state.items() if k != _SPECIAL_KEY}
+        if goal is None:
+            goal = self.agent.cognitive.generate_goal(world_state)
+        key = (json.dumps(world_state, sort_keys=True), goal)
+        now = time.monotonic()
+        with self._lock:
+            self._stats["requests"] += 1
+            pending = self._inflight.get(key)
+            if pending is not None:
+                self._stats["coalesced"] += 1
+                pending[2].append(now)
+                return pending[1]
+            future: Future = Future()
+            self._inflight[key] = (world_state, future, [now])
+        self._queue.put(key)
+        return future
+
+    def plan(
+        self, world_state: Dict[str, Any], goal: Optional[str] = None, timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Plan for a world state and wait for the result.
+
+        Args:
+            world_state (dict): The world state to plan from.
+            goal (str, optional): Goal to plan for. Generated from the state if omitted.
+            timeout (float, optional): Seconds to wait for the result.
+        Returns:
+            dict: The goal, plan, and justification.
+        """
+        return self.submit(world_state, goal).result(timeout)
+
+    def plan_many(
+        self, world_states: List[Dict[str, Any]], goal: Optional[str] = None, timeout: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Queue several world states before waiting, so duplicates among them coalesce, then return all results.
+
+        Args:
+            world_states (list): The world states to plan from.
+            goal (str, optional): Goal to plan for. Generated per state if omitted.
+            timeout (float, optional): Seconds to wait for each result.
+        Returns:
+            list: One dict with the goal, plan, and justification per world state.
+        """
+        futures = [self.submit(world_state, goal) for world_state in world_states]
+        return [future.result(timeout) for future in futures]
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Return throughput and latency metrics.
+
+        Requests are counted once they are answered: "completed" on success, "errors" on failure.
+        Latency runs from submission to answer and covers completed requests only.
+
+        Returns:
+            dict: Request counters, planner calls, throughput, and latency in milliseconds.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            pending = len(self._inflight)
+        uptime = time.monotonic() - self._started_at
+        completed = stats["completed"]
+        return {
+            "uptime_s": round(uptime, 3),
+            "requests": stats["requests"],
+            "coalesced": stats["coalesced"],
+            "completed": completed,
+            "errors": stats["errors"],
+            "pending": pending,
+            "plans_computed": stats["plans_computed"],
+            "throughput_rps": round(completed / uptime, 3) if uptime > 0 else 0.0,
+            "latency_avg_ms": round(1000 * stats["latency_total"] / completed, 3) if completed else 0.0,
+            "latency_max_ms": round(1000 * stats["latency_max"], 3),
+        }
+
+    def _run(self):
+        """
+        Worker loop: plan queued requests one at a time until the shutdown sentinel arrives.
+        """
+        while True:
+            key = self._queue.get()
+            if key is None:
+                return
+            with self._lock:
+                state, future = self._inflight[key][:2]
+            try:
+                goal, plan, justification = self.agent.plan_for(state, key[1])
+                result = {"goal": goal, "plan": plan, "justification": justification}
+                error = None
+            except Exception as exc:  # Report the failure to every waiting client
+                error = exc
+            now = time.monotonic()
+            with self._lock:
+                waiting = self._inflight.pop(key)[2]
+                self._stats["plans_computed"] += 1
+                if error is not None:
+                    self._stats["errors"] += len(waiting)
+                else:
+                    self._stats["completed"] += len(waiting)
+                    for enqueued in waiting:
+                        latency = now - enqueued
+                        self._stats["latency_total"] += latency
+                        self._stats["latency_max"] = max(self._stats["latency_max"], latency)
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+
+class _PlanningRequestHandler(BaseHTTPRequestHandler):
+    """
+    HTTP handler for the planning service.
+
+    Endpoints:
+        - POST /plan: Body {"state": {...}, "goal": optional} or {"states": [{...}, ...]}.
+          Malformed requests get 400; failures inside the planner get 500.
+        - GET /metrics: Service metrics.
+    """
+
+    def do_GET(self):
+        if self.path == "/metrics":
+            self._send_json(200, self.server.service.metrics())
+        else:
+            self._send_json(404, {"error": f"Unknown path: {self.path}"})
+
+    def do_POST(self):
+        if self.path != "/plan":
+            self._send_json(404, {"error": f"Unknown path: {self.path}"})
+            return
+        service = self.server.service
+        # Only parsing, validation and goal generation errors are the client's fault
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length) or b"{}")
+            if not isinstance(request, dict):
+                raise TypeError(f"request body must be a JSON object, not {type(request).__name__}")
+            if "states" in request:
+                if not isinstance(request["states"], list):
+                    raise TypeError(f"states must be a list, not {type(request['states']).__name__}")
+                futures = [service.submit(state, request.get("goal")) for state in request["states"]]
+            else:
+                futures = [service.submit(request["state"], request.get("goal"))]
+        except (ValueError, KeyError, TypeError) as exc:
+            self._send_json(400, {"error": f"Invalid request: {exc!r}"})
+            return
+        try:
+            results = [future.result() for future in futures]
+        except Exception as exc:  # Planner failure, not a bad request
+            self._send_json(500, {"error": f"Planning failed: {exc!r}"})
+            return
+        self._send_json(200, {"results": results} if "states" in request else results[0])
+
+    def address_string(self):
+        # Unix socket clients have no (host, port) address
+        return self.client_address[0] if self.client_address else "unix"
+
+    def log_message(self, format, *args):
+        # Keep the daemon quiet; use /metrics for monitoring
+        pass
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Threaded HTTP server bound to a local Unix socket.
+    """
+
+    daemon_threads = True
+
+
+def _is_socket(path: str) -> bool:
+    """
+    Return True if path exists and is a Unix socket (symlinks are not followed).
+    """
+    try:
+        return stat.S_ISSOCK(os.lstat(path).st_mode)
+    except FileNotFoundError:
+        return False
+
+
+def create_server(service: PlanningService, host: str = "127.0.0.1", port: int = 8765, socket_path: str = None):
+    """
+    Create an HTTP server for the planning service.
+
+    Args:
+        service (PlanningService): The service to expose.
+        host (str): Host to bind when serving TCP. Defaults to localhost only.
+        port (int): Port to bind when serving TCP.
+        socket_path (str, optional): Serve on this Unix socket instead of TCP. A stale socket
+            at the path is replaced; any other existing file is left alone.
+    Returns:
+        socketserver.BaseServer: The bound (not yet serving) server.
+    Raises:
+        FileExistsError: If socket_path exists and is not a socket.
+    """
+    if socket_path:
+        if _is_socket(socket_path):
+            os.unlink(socket_path)
+        elif os.path.lexists(socket_path):
+            raise FileExistsError(f"{socket_path} exists and is not a socket")
+        server = _UnixHTTPServer(socket_path, _PlanningRequestHandler)
+    else:
+        server = ThreadingHTTPServer((host, port), _PlanningRequestHandler)
+        server.daemon_threads = True
+    server.service = service
+    return server
+
+
+def run_service(host: str = "127.0.0.1", port: int = 8765, socket_path: str = None):
+    """
+    Run the planning service until interrupted.
+
+    Args:
+        host (str): Host to bind when serving TCP.
+        port (int): Port to bind when serving TCP.
+        socket_path (str, optional): Serve on this Unix socket instead of TCP.
+    """
+    service = PlanningService()
+    server = create_server(service, host, port, socket_path)
+    service.start()
+    where = socket_path or f"http://{host}:{port}"
+    print(f"[Service] Planning service listening on {where} (POST /plan, GET /metrics)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n[Service] Shutting down.")
+    finally:
+        server.server_close()
+        service.stop()
+        if socket_path and _is_socket(socket_path):
+            os.unlink(socket_path)
+
+
+__all__ = ["PlanningService", "create_server", "run_service"]
@@ -6,6 +6,16 @@ Dungeon environment module for the Dungeon Guardian Agent project.
 - Handles action execution, simulating success/failure and updating world state.
 """
 
+# Chance that each action fails when executed (actions not listed always succeed)
+FAIL_CHANCE = {
+    "HealSelf": 0.2,  # 20% chance potion is spoiled/stolen
+    "AttackEnemy": 0.1,
+    "Retreat": 0.05,
+    "DefendTreasure": 0.05,
+    "CallBackup": 0.1,
+    "SearchForPotion": 0.15,
+}
+
 
 class DungeonEnvironment:
     """
@@ -17,14 +27,16 @@ class DungeonEnvironment:
         - execute_action(action, state): Simulate action execution, update state, and return (new_state, success).
     """
 
-    def __init__(self, width=5, height=5):
+    def __init__(self, width=5, height=5, actions=None):
         """
         Initialize the dungeon environment.
 
         Args:
             width (int): Width of the dungeon grid.
             height (int): Height of the dungeon grid.
+            actions (list, optional): GOAPAction set used to apply effects. Defaults to agent.planning.ACTIONS.
         """
+        self.actions = actions
         self.width = width
         self.height = height
         self.grid = [[0 for _ in range(width)] for _ in range(height)]
@@ -56,20 +68,12 @@ class DungeonEnvironment:
         import random
 
         # Simulate possible failure for some actions
-        fail_chance = {
-            "HealSelf": 0.2,  # 20% chance potion is spoiled/stolen
-            "AttackEnemy": 0.1,
-            "Retreat": 0.05,
-            "DefendTreasure": 0.05,
-            "CallBackup": 0.1,
-            "SearchForPotion": 0.15,
-        }
-        success = random.random() > fail_chance.get(action, 0)
+        success = random.random() > FAIL_CHANCE.get(action, 0)
         # Only update state if action succeeded
         if success:
             from agent.planning import ACTIONS
 
-            act = next((a for a in ACTIONS if a.name == action), None)
+            act = next((a for a in (self.actions or ACTIONS) if a.name == action), None)
             if act:
                 # Use patched apply to handle lambdas
                 new_state = act.apply(state)
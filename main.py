@@ -3,6 +3,7 @@ import subprocess
 import sys
 
 from agent import DungeonGuardianAgent
+from agent.planning import GOAPPlanner, load_actions_from_ini, search_budget
 from environment import DungeonEnvironment
 from training import run_episode
 from utils import print_banner
@@ -10,7 +11,7 @@ from utils import print_banner
 # Entry point for Dungeon Guardian Agent project
 
 
-def interactive_mode():
+def interactive_mode(stochastic=False):
     print_banner()
     env = DungeonEnvironment()
     agent = DungeonGuardianAgent()
@@ -52,21 +53,37 @@ def interactive_mode():
                 "enemyNearby": enemy,
                 "inSafeZone": safe,
             }
-            run_episode(env, agent, world_state=world_state)
+            run_episode(env, agent, world_state=world_state, stochastic=stochastic)
         except KeyboardInterrupt:
             print("\nExiting interactive mode. Goodbye!")
             break
 
 
-def run_scenarios_from_json(json_path):
+def run_scenarios_from_json(json_path, stochastic=False, actions_path=None, max_depth=None, max_plan_length=None):
 
     print_banner()
-    env = DungeonEnvironment()
     agent = DungeonGuardianAgent()
+    if actions_path:
+        actions = load_actions_from_ini(actions_path)
+        agent.planner = GOAPPlanner(actions)
+        env = DungeonEnvironment(actions=actions)
+        # Start from search limits sized to the loaded action set (a heuristic) unless given explicitly
+        if max_depth is None:
+            max_depth = search_budget(len(actions))
+        if max_plan_length is None:
+            max_plan_length = len(actions)
+        print(f"\nLoaded {len(actions)} actions from {actions_path}")
+        print(f"Search budget: {max_depth} states | Max plan length (stochastic): {max_plan_length}")
+    else:
+        env = DungeonEnvironment()
     print(f"\nLoading scenarios from {json_path} ...")
     with open(json_path, "r", encoding="utf-8") as f:
-        scenarios = json.load(f)
+        if json_path.endswith(".jsonl"):
+            scenarios = [json.loads(line) for line in f if line.strip()]
+        else:
+            scenarios = json.load(f)
     output_buffer = []
+    achieved = replans = 0
     for i, scenario in enumerate(scenarios, 1):
         scenario_output = f"\n=== Scenario {i} ===\n"
         print(scenario_output, end="")
@@ -76,11 +93,23 @@ def run_scenarios_from_json(json_path):
         temp_stdout = StringIO()
         sys_stdout = sys.stdout
         sys.stdout = temp_stdout
-        run_episode(env, agent, world_state=scenario)
+        outcome = run_episode(
+            env,
+            agent,
+            world_state=scenario,
+            stochastic=stochastic,
+            max_depth=max_depth,
+            max_plan_length=max_plan_length,
+        )
         sys.stdout = sys_stdout
         episode_output = temp_stdout.getvalue()
         print(episode_output, end="")
         output_buffer.append(episode_output)
+        achieved += outcome["goal_achieved"]
+        replans += outcome["replans"]
+    summary = f"\n=== Summary ===\nGoals achieved: {achieved}/{len(scenarios)} | Total replans: {replans}\n"
+    print(summary, end="")
+    output_buffer.append(summary)
     full_output = "".join(output_buffer)
     # Copy to clipboard (Linux/xclip)
     try:
@@ -91,33 +120,104 @@ def run_scenarios_from_json(json_path):
         print("\n[INFO] To get Copilot reasoning, copy the above output and paste it into Copilot Chat in VS Code.")
 
 
+def serve_mode(target=None):
+    from agent.service import run_service
+
+    print_banner()
+    try:
+        if target and not target.isdigit():
+            run_service(socket_path=target)
+        else:
+            run_service(port=int(target) if target else 8765)
+    except OSError as exc:
+        print(f"[ERROR] Could not start the planning service: {exc}")
+        sys.exit(1)
+
+
 def show_help():
     print_banner()
     print(
         """
-Usage: python main.py [interactive|<scenarios.json>]
+Usage: python main.py interactive [--stochastic]
+       python main.py serve [port|socket_path]
+       python main.py <scenarios.json> [--stochastic] [--actions <file>] [--max-depth N] [--max-plan-length N]
 
 Modes:
   interactive         Run the agent in interactive mode (enter scenarios by hand)
-  <scenarios.json>    Run the agent on a batch of scenarios from a JSON file
+  serve               Run a resident planning service on localhost (default port 8765)
+                      or on a Unix socket when a path is given
+  <scenarios.json>    Run the agent on a batch of scenarios from a JSON (or .jsonl) file
+
+Options:
+  --stochastic        Pick the plan most likely to succeed given action failure chances
+  --actions <file>    Plan batch scenarios with the full action set (preconditions, effects, cost)
+                      from an INI file, e.g. one made by `python -m utils.generator`
+  --max-depth N       Maximum number of states the planner may expand (batch only; defaults to a
+                      budget sized to the action count when --actions is given)
+  --max-plan-length N Maximum candidate plan length for --stochastic (batch only; defaults to the
+                      action count when --actions is given)
 
 Examples:
   python main.py interactive
+  python main.py serve /tmp/guardian.sock
   python main.py true_multistep_scenarios.json
+  python main.py true_multistep_scenarios.json --stochastic
+  python main.py load_test.jsonl --actions load_test.ini
 
 After batch runs, output is copied to your clipboard (Linux/xclip required) for easy Copilot Chat use in VS Code.
 """
     )
 
 
+def _pop_option(args, name, cast=str):
+    """
+    Remove "name value" from args and return the cast value, or None if the option is absent.
+    Exits with an error if the value is missing or invalid.
+    """
+    if name not in args:
+        return None
+    i = args.index(name)
+    if i + 1 >= len(args) or args[i + 1].startswith("--"):
+        print(f"[ERROR] {name} requires a value.")
+        sys.exit(2)
+    raw = args.pop(i + 1)
+    args.pop(i)
+    try:
+        return cast(raw)
+    except ValueError:
+        print(f"[ERROR] Invalid value for {name}: {raw}")
+        sys.exit(2)
+
+
 def main():
     args = sys.argv[1:]
+    stochastic = "--stochastic" in args
+    args = [arg for arg in args if arg != "--stochastic"]
+    batch_options = {
+        "actions_path": _pop_option(args, "--actions"),
+        "max_depth": _pop_option(args, "--max-depth", int),
+        "max_plan_length": _pop_option(args, "--max-plan-length", int),
+    }
+    unknown = [arg for arg in args if arg.startswith("--")]
+    if unknown:
+        print(f"[ERROR] Unknown option: {unknown[0]}")
+        sys.exit(2)
+    batch_only = any(value is not None for value in batch_options.values())
     if args:
+        if args[0].endswith((".json", ".jsonl")):
+            run_scenarios_from_json(args[0], stochastic, **batch_options)
+            return
+        if batch_only:
+            print("[ERROR] --actions, --max-depth and --max-plan-length only apply to batch scenario runs.")
+            sys.exit(2)
         if args[0] == "interactive":
-            interactive_mode()
+            interactive_mode(stochastic)
             return
-        elif args[0].endswith(".json"):
-            run_scenarios_from_json(args[0])
+        elif args[0] == "serve":
+            if stochastic:
+                print("[ERROR] --stochastic does not apply to serve mode.")
+                sys.exit(2)
+            serve_mode(args[1] if len(args) > 1 else None)
             return
     show_help()
 
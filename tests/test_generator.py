@@ -0,0 +1,110 @@
+"""
+Tests for INI action loading and the synthetic action-set generator.
+"""
+
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+from agent import planning
+from utils import generator
+
+
+class ParseEffectValueTest(unittest.TestCase):
+    def test_deltas(self):
+        self.assertEqual(planning.parse_effect_value("+5")(10), 15)
+        self.assertEqual(planning.parse_effect_value(" -10 ")(10), 0)
+
+    def test_literals(self):
+        self.assertIs(planning.parse_effect_value("True"), True)
+        self.assertIs(planning.parse_effect_value("false"), False)
+        self.assertEqual(planning.parse_effect_value("100"), 100)
+        self.assertEqual(planning.parse_effect_value("low"), "low")
+
+
+class LoadActionsFromIniTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "actions.ini")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_effects_and_cost_round_trip(self):
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(
+                "[Drink]\n"
+                "preconditions = hasPotion=True; health=<100\n"
+                "effects = hasPotion=False; health=+30; mood=calm\n"
+                "cost = 3\n"
+                "\n"
+                "[Wait]\n"
+                "preconditions = enemyNearby=False\n"
+            )
+        drink, wait = planning.load_actions_from_ini(self.path)
+        self.assertEqual((drink.name, drink.cost, wait.name, wait.cost), ("Drink", 3, "Wait", 1))
+        self.assertEqual(wait.effects, {})
+        state = {"hasPotion": True, "health": 50}
+        self.assertTrue(drink.is_applicable(state))
+        self.assertEqual(drink.apply(state), {"hasPotion": False, "health": 80, "mood": "calm"})
+        self.assertFalse(drink.is_applicable({"hasPotion": True, "health": 100}))
+
+    def test_generated_actions_load_back(self):
+        config = generator.generate_action_config(depth=3, branching=4, numeric_ratio=1.0, seed=7)
+        generator.write_action_config(config, self.path)
+        actions = planning.load_actions_from_ini(self.path)
+        self.assertEqual([a.name for a in actions], config.sections())
+        self.assertEqual(len(actions), 12)
+        for action, section in zip(actions, config.sections()):
+            self.assertEqual(action.cost, config[section].getint("cost"))
+            self.assertEqual(len(action.preconditions), len(config[section]["preconditions"].split(";")))
+            self.assertEqual(len(action.effects), len(config[section]["effects"].split(";")))
+
+
+class GeneratorTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.depth, self.branching = 4, 3
+        path = os.path.join(self.tmpdir.name, "actions.ini")
+        config = generator.generate_action_config(self.depth, self.branching, numeric_ratio=0.5, seed=3)
+        generator.write_action_config(config, path)
+        self.actions = {action.name: action for action in planning.load_actions_from_ini(path)}
+        self.scenarios = generator.generate_scenarios(5, self.depth, self.branching, seed=3)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_step_zero_chain_reaches_goal_in_depth_steps(self):
+        for scenario in self.scenarios:
+            state = scenario
+            for d in range(self.depth):
+                self.assertFalse(state["inSafeZone"])
+                action = self.actions[f"Stage{d}Step0"]
+                self.assertTrue(action.is_applicable(state))
+                state = action.apply(state)
+            self.assertTrue(state["inSafeZone"])
+
+    def test_planner_finds_plans_of_depth_length(self):
+        planner = planning.GOAPPlanner(list(self.actions.values()))
+        budget = planning.search_budget(len(self.actions))
+        for scenario in self.scenarios:
+            plan = planner.plan(scenario, lambda s: s["inSafeZone"], max_depth=budget)
+            self.assertIsNotNone(plan)
+            self.assertEqual(len(plan), self.depth)
+
+    def test_benchmark_fails_when_scenarios_have_no_plan(self):
+        out = os.path.join(self.tmpdir.name, "lt")
+        args = ["--depth", "3", "--branching", "3", "--scenarios", "3", "--seed", "1", "--out", out, "--benchmark"]
+        with redirect_stdout(io.StringIO()):
+            generator.main(args)
+            with self.assertRaises(SystemExit) as exit_info:
+                generator.main(args + ["--max-depth", "1"])
+        self.assertEqual(exit_info.exception.code, 1)
+        for ext in (".ini", ".json", ".jsonl"):
+            self.assertTrue(os.path.exists(out + ext))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+"""
+Tests for stochastic plan evaluation in the GOAP planner.
+"""
+
+import io
+import math
+import unittest
+from contextlib import redirect_stdout
+
+from agent import DungeonGuardianAgent
+from agent.planning import ACTIONS, GOAPAction, GOAPPlanner
+from environment import FAIL_CHANCE, DungeonEnvironment
+from training import run_episode
+
+
+def _reach_goal(state):
+    return state["done"]
+
+
+class EvaluatePlanTest(unittest.TestCase):
+    def setUp(self):
+        self.planner = GOAPPlanner(ACTIONS)
+
+    def test_expected_cost_and_success_probability(self):
+        evaluation = self.planner.evaluate_plan(["SearchForPotion", "HealSelf", "MoveToSafeZone"], FAIL_CHANCE)
+        # Costs 2, 2, 1 with failure chances 0.15, 0.2, 0
+        self.assertAlmostEqual(evaluation["expected_cost"], 2 / 0.85 + 2 / 0.8 + 1)
+        self.assertAlmostEqual(evaluation["expected_cost"], 5.853, places=3)
+        self.assertAlmostEqual(evaluation["success_probability"], 0.85 * 0.8)
+        self.assertAlmostEqual(evaluation["expected_failures"], 0.15 / 0.85 + 0.2 / 0.8)
+
+    def test_certain_failure_has_infinite_cost(self):
+        evaluation = self.planner.evaluate_plan(["MoveToSafeZone", "Retreat"], {"Retreat": 1.0})
+        self.assertEqual(evaluation["success_probability"], 0)
+        self.assertTrue(math.isinf(evaluation["expected_cost"]))
+        self.assertTrue(math.isinf(evaluation["expected_failures"]))
+
+    def test_empty_plan(self):
+        evaluation = self.planner.evaluate_plan([], FAIL_CHANCE)
+        self.assertEqual(evaluation["plan"], [])
+        self.assertEqual(evaluation["success_probability"], 1.0)
+        self.assertEqual(evaluation["expected_cost"], 0.0)
+        self.assertEqual(evaluation["expected_failures"], 0.0)
+
+
+class PlanRobustTest(unittest.TestCase):
+    def test_prefers_higher_success_probability_over_lower_cost(self):
+        planner = GOAPPlanner(
+            [
+                GOAPAction("Risky", {"done": False}, {"done": True}, cost=1),
+                GOAPAction("Safe", {"done": False}, {"done": True}, cost=5),
+            ]
+        )
+        best = planner.plan_robust({"done": False}, _reach_goal, {"Risky": 0.5})
+        self.assertEqual(best["plan"], ["Safe"])
+
+    def test_ties_on_success_break_by_expected_cost_then_length(self):
+        planner = GOAPPlanner(
+            [
+                GOAPAction("Expensive", {"done": False}, {"done": True}, cost=3),
+                GOAPAction("Direct", {"done": False}, {"done": True}, cost=2),
+                GOAPAction("Prepare", {"ready": False}, {"ready": True}, cost=1),
+                GOAPAction("Finish", {"ready": True, "done": False}, {"done": True}, cost=1),
+            ]
+        )
+        best = planner.plan_robust({"done": False, "ready": False}, _reach_goal, {})
+        # Direct and Prepare -> Finish both cost 2; the shorter plan wins
+        self.assertEqual(best["plan"], ["Direct"])
+        self.assertEqual(best["expected_cost"], 2)
+
+    def test_goal_already_holds(self):
+        planner = GOAPPlanner(ACTIONS)
+        best = planner.plan_robust({"done": True}, _reach_goal, FAIL_CHANCE)
+        self.assertEqual(best["plan"], [])
+
+    def test_no_plan(self):
+        planner = GOAPPlanner([GOAPAction("Noop", {"done": True}, {}, cost=1)])
+        self.assertIsNone(planner.plan_robust({"done": False}, _reach_goal, {}))
+
+
+class CandidatePlansTest(unittest.TestCase):
+    def setUp(self):
+        self.planner = GOAPPlanner(
+            [
+                GOAPAction("Direct", {"done": False}, {"done": True}, cost=2),
+                GOAPAction("Prepare", {"ready": False}, {"ready": True}, cost=1),
+                GOAPAction("Unprepare", {"ready": True}, {"ready": False}, cost=1),
+                GOAPAction("Finish", {"ready": True, "done": False}, {"done": True}, cost=1),
+            ]
+        )
+        self.start = {"done": False, "ready": False}
+
+    def test_shortest_first_without_cycles(self):
+        plans = self.planner.candidate_plans(self.start, _reach_goal)
+        self.assertEqual(plans[0], ["Direct"])
+        self.assertIn(["Prepare", "Finish"], plans)
+        # Prepare -> Unprepare returns to the start state, so it is never extended
+        self.assertFalse(any(plan[:2] == ["Prepare", "Unprepare"] for plan in plans))
+
+    def test_max_length(self):
+        self.assertEqual(self.planner.candidate_plans(self.start, _reach_goal, max_length=1), [["Direct"]])
+
+
+class _FailOnceEnvironment(DungeonEnvironment):
+    """
+    Environment where the first action fails and every later one succeeds.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def execute_action(self, action, state):
+        self.calls += 1
+        if self.calls == 1:
+            return state, False
+        act = next(a for a in ACTIONS if a.name == action)
+        return act.apply(state), True
+
+
+class RunEpisodeReplansTest(unittest.TestCase):
+    def test_failed_action_counts_as_replan(self):
+        state = {
+            "health": 80,
+            "enemyNearby": False,
+            "hasPotion": False,
+            "treasureThreatLevel": "low",
+            "stamina": 10,
+            "inSafeZone": False,
+        }
+        with redirect_stdout(io.StringIO()) as output:
+            outcome = run_episode(_FailOnceEnvironment(), DungeonGuardianAgent(), world_state=state, stochastic=True)
+        self.assertEqual(outcome["replans"], 1)
+        self.assertTrue(outcome["goal_achieved"])
+        self.assertIn("Replans: 1", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
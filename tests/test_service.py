@@ -0,0 +1,217 @@
+"""
+Tests for the resident planning service.
+"""
+
+import http.client
+import json
+import os
+import socket
+import tempfile
+import threading
+import time
+import unittest
+
+from agent import DungeonGuardianAgent
+from agent.service import PlanningService, create_server
+
+STATE = {
+    "health": 10,
+    "enemyNearby": True,
+    "hasPotion": False,
+    "treasureThreatLevel": "high",
+    "stamina": 5,
+    "inSafeZone": False,
+}
+
+
+class _GatedAgent(DungeonGuardianAgent):
+    """
+    Agent whose planning blocks until released, so requests stay in flight for as long as a test needs.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+        self.calls = 0
+
+    def plan_for(self, world_state, goal=None):
+        self.calls += 1
+        self.release.wait(5)
+        return super().plan_for(world_state, goal)
+
+
+class PlanningServiceTest(unittest.TestCase):
+    def setUp(self):
+        self.agent = _GatedAgent()
+        self.service = PlanningService(self.agent)
+        self.service.start()
+
+    def tearDown(self):
+        self.agent.release.set()
+        self.service.stop()
+
+    def test_identical_inflight_requests_are_coalesced(self):
+        futures = [self.service.submit(dict(STATE)) for _ in range(10)]
+        self.agent.release.set()
+        results = [future.result(5) for future in futures]
+        self.assertEqual(self.agent.calls, 1)
+        self.assertTrue(all(result == results[0] for result in results))
+        self.assertEqual(results[0]["goal"], "Survive")
+        metrics = self.service.metrics()
+        self.assertEqual(metrics["requests"], 10)
+        self.assertEqual(metrics["coalesced"], 9)
+        self.assertEqual(metrics["plans_computed"], 1)
+
+    def test_metrics_count_requests_served_through_submit(self):
+        self.agent.release.set()
+        for health in range(10, 60, 10):
+            self.service.submit(dict(STATE, health=health)).result(5)
+        metrics = self.service.metrics()
+        self.assertEqual(metrics["completed"], 5)
+        self.assertEqual(metrics["errors"], 0)
+        self.assertGreater(metrics["throughput_rps"], 0)
+        self.assertGreater(metrics["latency_avg_ms"], 0)
+
+    def test_failed_requests_count_as_errors(self):
+        self.agent.release.set()
+        future = self.service.submit({"health": 80}, goal="Patrol")
+        with self.assertRaises(KeyError):
+            future.result(5)
+        metrics = self.service.metrics()
+        self.assertEqual(metrics["errors"], 1)
+        self.assertEqual(metrics["completed"], 0)
+
+    def test_special_mode_key_is_ignored(self):
+        self.agent.release.set()
+        start = time.monotonic()
+        result = self.service.plan(dict(STATE, hell_mode=True), timeout=5)
+        self.assertLess(time.monotonic() - start, 5)
+        self.assertEqual(result["plan"], self.service.plan(dict(STATE), timeout=5)["plan"])
+
+    def test_stop_serves_queued_requests(self):
+        futures = [self.service.submit(dict(STATE, stamina=stamina)) for stamina in range(3)]
+        stopper = threading.Thread(target=self.service.stop)
+        stopper.start()
+        self.agent.release.set()
+        stopper.join(5)
+        self.assertFalse(stopper.is_alive())
+        self.assertTrue(all(future.done() and future.exception() is None for future in futures))
+        self.assertEqual(self.service.metrics()["pending"], 0)
+
+
+class _BrokenAgent(DungeonGuardianAgent):
+    """
+    Agent whose planner always fails, standing in for an internal planner bug.
+    """
+
+    def plan_for(self, world_state, goal=None):
+        raise RuntimeError("planner bug")
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, socket_path):
+        super().__init__("localhost", timeout=5)
+        self.socket_path = socket_path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(5)
+        self.sock.connect(self.socket_path)
+
+
+class PlanningServerTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.servers = []
+
+    def tearDown(self):
+        for server, service in self.servers:
+            server.shutdown()
+            server.server_close()
+            service.stop()
+        self.tmpdir.cleanup()
+
+    def _serve(self, agent=None, socket_path=None):
+        service = PlanningService(agent)
+        server = create_server(service, port=0, socket_path=socket_path)
+        service.start()
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.servers.append((server, service))
+        if socket_path:
+            return lambda: _UnixHTTPConnection(socket_path)
+        host, port = server.server_address
+        return lambda: http.client.HTTPConnection(host, port, timeout=5)
+
+    def _request(self, connect, method, path, body=None):
+        conn = connect()
+        conn.request(method, path, body=body if body is None or isinstance(body, bytes) else json.dumps(body))
+        response = conn.getresponse()
+        payload = json.loads(response.read())
+        conn.close()
+        return response.status, payload
+
+    def test_plan_and_metrics_over_tcp(self):
+        connect = self._serve()
+        status, result = self._request(connect, "POST", "/plan", {"state": STATE})
+        self.assertEqual(status, 200)
+        self.assertEqual(result["goal"], "Survive")
+        status, result = self._request(connect, "POST", "/plan", {"states": [STATE, STATE]})
+        self.assertEqual(status, 200)
+        self.assertEqual(len(result["results"]), 2)
+        status, metrics = self._request(connect, "GET", "/metrics")
+        self.assertEqual(status, 200)
+        self.assertEqual(metrics["requests"], 3)
+        self.assertEqual(metrics["completed"], 3)
+
+    def test_bad_requests_get_400(self):
+        connect = self._serve()
+        bodies = [
+            {"state": [1, 2]},
+            {"states": [1]},
+            {"states": "ab"},
+            {"state": {"health": 80}},
+            {"state": STATE, "goal": 5},
+            [STATE],
+            {},
+            b"not json",
+        ]
+        for body in bodies:
+            with self.subTest(body=body):
+                status, result = self._request(connect, "POST", "/plan", body)
+                self.assertEqual(status, 400)
+                self.assertIn("Invalid request", result["error"])
+
+    def test_unknown_paths_get_404(self):
+        connect = self._serve()
+        self.assertEqual(self._request(connect, "GET", "/nope")[0], 404)
+        self.assertEqual(self._request(connect, "POST", "/nope", {})[0], 404)
+
+    def test_planner_failures_get_500(self):
+        connect = self._serve(agent=_BrokenAgent())
+        status, result = self._request(connect, "POST", "/plan", {"state": STATE})
+        self.assertEqual(status, 500)
+        self.assertIn("planner bug", result["error"])
+        self.assertEqual(self._request(connect, "GET", "/metrics")[1]["errors"], 1)
+
+    def test_plan_over_unix_socket_replaces_stale_socket(self):
+        socket_path = os.path.join(self.tmpdir.name, "guardian.sock")
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(socket_path)
+        stale.close()
+        connect = self._serve(socket_path=socket_path)
+        status, result = self._request(connect, "POST", "/plan", {"state": STATE})
+        self.assertEqual(status, 200)
+        self.assertEqual(result["plan"], ["Retreat"])
+
+    def test_existing_regular_file_is_not_replaced(self):
+        path = os.path.join(self.tmpdir.name, "important.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("keep me")
+        with self.assertRaises(FileExistsError):
+            create_server(PlanningService(), socket_path=path)
+        with open(path, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "keep me")
+
+
+if __name__ == "__main__":
+    unittest.main()
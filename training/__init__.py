@@ -4,8 +4,10 @@ Training module for the Dungeon Guardian Agent project.
 
 import base64
 
+from environment import FAIL_CHANCE
 
-def run_episode(env, agent, world_state=None):
+
+def run_episode(env, agent, world_state=None, stochastic=False, max_depth=None, max_plan_length=None):
     """
     Run a full episode: agent plans, acts, and replans if needed.
     Accepts a custom world_state for scenario testing.
@@ -14,6 +16,14 @@ def run_episode(env, agent, world_state=None):
         env (DungeonEnvironment): The dungeon environment.
         agent (DungeonGuardianAgent): The agent.
         world_state (dict, optional): The initial world state. Defaults to None.
+        stochastic (bool): If True, pick the plan most likely to succeed under the
+            environment's action failure chances instead of the first plan found.
+        max_depth (int, optional): Maximum number of states the planner may expand.
+            Defaults to the planner's own limits.
+        max_plan_length (int, optional): Maximum length of candidate plans in stochastic mode.
+            Defaults to the planner's own limit.
+    Returns:
+        dict: Whether the goal was achieved, steps taken, and replans (plans made after the first).
     """
     env.reset()
     # Use provided world_state or default
@@ -30,6 +40,8 @@ def run_episode(env, agent, world_state=None):
     step = 0
     plan = None
     goal = None
+    plans_made = 0
+    goal_achieved = False
     while step < max_steps:
         print(f"\n--- Step {step+1} ---")
         if not plan:
@@ -47,11 +59,30 @@ def run_episode(env, agent, world_state=None):
                 "Patrol": lambda s: s["inSafeZone"],
             }
             goal_fn = goal_checks.get(goal, lambda s: True)
-            plan = agent.planner.plan(world_state, goal_fn, special_mode=special_mode)
+            plans_made += 1
+            if stochastic and not special_mode:
+                limits = {}
+                if max_depth is not None:
+                    limits["max_expansions"] = max_depth
+                if max_plan_length is not None:
+                    limits["max_length"] = max_plan_length
+                evaluation = agent.planner.plan_robust(world_state, goal_fn, FAIL_CHANCE, **limits)
+                plan = evaluation["plan"] if evaluation else None
+            else:
+                evaluation = None
+                limits = {"max_depth": max_depth} if max_depth is not None else {}
+                plan = agent.planner.plan(world_state, goal_fn, special_mode=special_mode, **limits)
             if not plan:
                 print(f"[Cognitive] Goal: {goal} | No valid plan found.")
                 break
-            print(f"[Cognitive] Goal: {goal} | Plan: {plan}")
+            if evaluation:
+                print(
+                    f"[Cognitive] Goal: {goal} | Plan: {plan} | "
+                    f"Success chance: {evaluation['success_probability']:.0%} | "
+                    f"Expected cost: {evaluation['expected_cost']:.2f}"
+                )
+            else:
+                print(f"[Cognitive] Goal: {goal} | Plan: {plan}")
         action = plan.pop(0)
         justification = agent.cognitive.justify_action(action, world_state, goal)
         print(f"[Execution] Action: {action} | Reason: {justification}")
@@ -74,9 +105,13 @@ def run_episode(env, agent, world_state=None):
         }
         if goal_checks.get(goal, lambda s: True)(world_state):
             print(f"[Success] Goal '{goal}' achieved!")
+            goal_achieved = True
             break
         if not plan:
             print("[Execution] Replanning...")
         step += 1
-    print(f"\nFinal world state: {world_state}")
+    replans = max(plans_made - 1, 0)
+    print(f"\nReplans: {replans}")
+    print(f"Final world state: {world_state}")
     print(f"Agent memory: {agent.cognitive.memory}")
+    return {"goal_achieved": goal_achieved, "steps": step + 1, "replans": replans}
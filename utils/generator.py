@@ -0,0 +1,203 @@
+"""
+Synthetic action-set and scenario generator for load testing the Dungeon Guardian Agent.
+
+- Generates layered GOAP action sets with configurable branching factor and chain depth.
+- Mixes in numeric comparisons and deltas using the INI syntax the planner already parses.
+- Emits matching scenarios as JSON (for main.py) or JSONL.
+- Can time GOAPPlanner.plan against the generated data.
+
+Usage:
+    python -m utils.generator --depth 4 --branching 6 --scenarios 200 --out load_test --benchmark
+"""
+
+import argparse
+import configparser
+import json
+import random
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+
+def generate_action_config(
+    depth: int = 5,
+    branching: int = 4,
+    numeric_ratio: float = 0.3,
+    num_stats: int = 3,
+    seed: Optional[int] = None,
+) -> configparser.ConfigParser:
+    """
+    Generate a layered GOAP action set as an INI config.
+
+    Action "Stage{d}Step{b}" sets the flag "stage{d}_{b}" and requires a flag from layer d - 1.
+    Step 0 of every layer forms a chain with no numeric preconditions, so the final layer (whose
+    actions set inSafeZone=True, the Patrol goal) is always reachable from a generated scenario.
+    The other steps get numeric comparisons (e.g. stat1=<40) and deltas (e.g. stat2=+5) on
+    "stat{i}" variables with probability numeric_ratio.
+
+    Args:
+        depth (int): Number of layers, i.e. the length of the shortest plan to the goal.
+        branching (int): Actions per layer. The action count is depth * branching.
+        numeric_ratio (float): Chance that a non-chain action gets a numeric precondition or effect.
+        num_stats (int): Number of numeric state variables.
+        seed (int, optional): Random seed for reproducible output.
+    Returns:
+        configparser.ConfigParser: Sections with preconditions, effects, and cost entries.
+    """
+    rng = random.Random(seed)
+    config = configparser.ConfigParser()
+    for d in range(depth):
+        for b in range(branching):
+            preconds = [f"stage{d}_{b}=False"]
+            effects = [f"stage{d}_{b}=True"]
+            if d > 0:
+                parent = 0 if b == 0 else rng.randrange(branching)
+                preconds.append(f"stage{d - 1}_{parent}=True")
+            if b > 0 and num_stats and rng.random() < numeric_ratio:
+                op = rng.choice("<>")
+                preconds.append(f"stat{rng.randrange(num_stats)}={op}{rng.randint(10, 90)}")
+            if b > 0 and num_stats and rng.random() < numeric_ratio:
+                effects.append(f"stat{rng.randrange(num_stats)}={rng.choice('+-')}{rng.randint(1, 20)}")
+            if d == depth - 1:
+                effects.append("inSafeZone=True")
+            config[f"Stage{d}Step{b}"] = {
+                "preconditions": "; ".join(preconds),
+                "effects": "; ".join(effects),
+                "cost": str(1 if b == 0 else rng.randint(1, 3)),
+            }
+    return config
+
+
+def generate_scenarios(
+    count: int = 100,
+    depth: int = 5,
+    branching: int = 4,
+    num_stats: int = 3,
+    seed: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Generate world states matching an action set from generate_action_config.
+
+    The standard world keys are set so the cognitive layer picks the Patrol goal, and every
+    stage flag starts False.
+
+    Args:
+        count (int): Number of scenarios.
+        depth (int): Layers in the matching action set.
+        branching (int): Actions per layer in the matching action set.
+        num_stats (int): Numeric state variables in the matching action set.
+        seed (int, optional): Random seed for reproducible output.
+    Returns:
+        list: World state dicts.
+    """
+    rng = random.Random(seed)
+    scenarios = []
+    for _ in range(count):
+        state = {
+            "health": rng.randint(50, 100),
+            "enemyNearby": False,
+            "hasPotion": rng.random() < 0.5,
+            "treasureThreatLevel": "low",
+            "stamina": rng.randint(5, 20),
+            "inSafeZone": False,
+        }
+        for i in range(num_stats):
+            state[f"stat{i}"] = rng.randint(0, 100)
+        for d in range(depth):
+            for b in range(branching):
+                state[f"stage{d}_{b}"] = False
+        scenarios.append(state)
+    return scenarios
+
+
+def write_action_config(config: configparser.ConfigParser, path: str):
+    """
+    Write a generated action set to an INI file readable by load_actions_from_ini.
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        config.write(f)
+
+
+def write_scenarios(scenarios: List[Dict[str, Any]], path: str):
+    """
+    Write scenarios as a JSON list, or one JSON object per line if path ends with .jsonl.
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        if path.endswith(".jsonl"):
+            for scenario in scenarios:
+                f.write(json.dumps(scenario) + "\n")
+        else:
+            json.dump(scenarios, f, indent=2)
+
+
+def benchmark_planner(actions, scenarios: List[Dict[str, Any]], max_depth: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Time GOAPPlanner.plan for the Patrol goal over the given scenarios.
+
+    Args:
+        actions (list): GOAPAction set to plan with.
+        scenarios (list): World states to plan from.
+        max_depth (int, optional): Passed through to GOAPPlanner.plan. Defaults to search_budget(len(actions)).
+    Returns:
+        dict: Search budget, plans found, total and average planning time in milliseconds.
+        Timings only describe successful planning when plans_found equals the scenario count.
+    """
+    from agent.planning import GOAPPlanner, search_budget
+
+    if max_depth is None:
+        max_depth = search_budget(len(actions))
+    planner = GOAPPlanner(actions)
+    found = 0
+    start = time.perf_counter()
+    for scenario in scenarios:
+        if planner.plan(scenario, lambda s: s["inSafeZone"], max_depth=max_depth):
+            found += 1
+    elapsed = time.perf_counter() - start
+    return {
+        "actions": len(actions),
+        "scenarios": len(scenarios),
+        "max_depth": max_depth,
+        "plans_found": found,
+        "total_ms": round(1000 * elapsed, 3),
+        "avg_ms": round(1000 * elapsed / len(scenarios), 3) if scenarios else 0.0,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate synthetic GOAP action sets and scenarios.")
+    parser.add_argument("--depth", type=int, default=5, help="Layers (shortest plan length)")
+    parser.add_argument("--branching", type=int, default=4, help="Actions per layer")
+    parser.add_argument("--numeric-ratio", type=float, default=0.3, help="Chance of numeric preconditions/effects")
+    parser.add_argument("--stats", type=int, default=3, help="Numeric state variables")
+    parser.add_argument("--scenarios", type=int, default=100, help="Scenarios to generate")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed")
+    parser.add_argument("--out", default="load_test", help="Output prefix for .ini, .json and .jsonl files")
+    parser.add_argument("--benchmark", action="store_true", help="Time GOAPPlanner.plan on the generated data")
+    parser.add_argument(
+        "--max-depth", type=int, default=None, help="max_depth for GOAPPlanner.plan (default: sized to action count)"
+    )
+    args = parser.parse_args(argv)
+
+    config = generate_action_config(args.depth, args.branching, args.numeric_ratio, args.stats, args.seed)
+    scenarios = generate_scenarios(args.scenarios, args.depth, args.branching, args.stats, args.seed)
+    write_action_config(config, f"{args.out}.ini")
+    write_scenarios(scenarios, f"{args.out}.json")
+    write_scenarios(scenarios, f"{args.out}.jsonl")
+    print(f"[Generator] Wrote {len(config.sections())} actions to {args.out}.ini")
+    print(f"[Generator] Wrote {len(scenarios)} scenarios to {args.out}.json and {args.out}.jsonl")
+    if args.benchmark:
+        from agent.planning import load_actions_from_ini
+
+        result = benchmark_planner(load_actions_from_ini(f"{args.out}.ini"), scenarios, args.max_depth)
+        print(f"[Benchmark] {result}")
+        missed = result["scenarios"] - result["plans_found"]
+        if missed:
+            print(
+                f"[ERROR] No plan found for {missed} of {result['scenarios']} scenarios with "
+                f"max_depth={result['max_depth']}; the timings include failed searches. Raise --max-depth."
+            )
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()